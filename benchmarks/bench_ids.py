@@ -0,0 +1,59 @@
+"""Benchmark bulk identifier normalization with :class:`locpy.api.LocIdCodec`.
+
+Run from the repository root::
+
+    $ python benchmarks/bench_ids.py [count]
+
+Reports identifiers per second for a fixed, seeded mix of bare IDs and
+``authorities/``, dataset and RWO URIs over http and https.
+"""
+
+import random
+import sys
+import time
+
+from locpy.api import LocAPI, LocIdCodec
+
+
+def sample_ids(count, seed=0):
+    """Generate ``count`` identifiers and URIs in mixed forms"""
+    rng = random.Random(seed)
+    prefixes = ['n', 'nr', 'no', 'sh', 'sj', 'mp', 'dg', 'gf', 'tgm', 'afset']
+    values = []
+    for _ in range(count):
+        loc_id = f'{rng.choice(prefixes)}{rng.randint(10**7, 10**8)}'
+        form = rng.random()
+        if form < 0.4:
+            values.append(loc_id)
+        elif form < 0.6:
+            values.append(LocAPI.uri_base + loc_id)
+        elif loc_id.startswith('n') and form < 0.7:
+            values.append(LocAPI.rwo_base.replace('http:', 'https:') + loc_id)
+        else:
+            uri = LocIdCodec.parse(loc_id).dataset_uri
+            values.append(uri if form < 0.8 else uri.replace('http:', 'https:'))
+    return values
+
+
+def timed(func, values):
+    start = time.perf_counter()
+    for _ in func(values):
+        pass
+    return len(values) / (time.perf_counter() - start)
+
+
+def main(count=1_000_000):
+    values = sample_ids(count)
+    runs = {
+        'parse_many': LocIdCodec.parse_many,
+        'normalize_many (loc_id)': lambda v: LocIdCodec.normalize_many(v, 'loc_id'),
+        'normalize_many (dataset_uri)': LocIdCodec.normalize_many,
+    }
+    for name, func in runs.items():
+        # best of three, to reduce noise
+        rate = max(timed(func, values) for _ in range(3))
+        print(f'{name:30} {rate / 1e6:6.2f}M IDs/s')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -1,7 +1,12 @@
 from rdflib import Namespace
-from urllib.parse import urljoin
+from urllib.parse import urljoin, quote
 from functools import cached_property
-from typing import Literal
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Literal, NamedTuple
+from string import ascii_lowercase
+import re
+import threading
+import unicodedata
 
 import rdflib
 import requests
@@ -42,42 +47,36 @@ class LocAPI(object):
     lcgft_base = 'http://id.loc.gov/authorities/genreForms/'
     # Real world entity base (used for queries)
     rwo_base = 'http://id.loc.gov/rwo/agents/'
+    # Known-label retrieval base
+    label_base = 'https://id.loc.gov/authorities/'
+    # status codes for a successful known-label match
+    redirect_codes = (301, 302, 303, 307, 308)
+
+    def __init__(self):
+        # (authority, label) -> reason, for labels LoC reports as not found
+        self.label_misses = {}
+
+    @classmethod
+    def label_url(cls, label, authority=None):
+        """Generate a URL for the known-label retrieval API"""
+        scope = f'{authority}/' if authority else ''
+        return f'{cls.label_base}{scope}label/{quote(label, safe="")}'
 
     @classmethod
     def uri_from_id(cls, loc_id):
         """Generate a URL for performing initial queries"""
-        return urljoin(cls.uri_base, loc_id)
+        return LocIdCodec.parse(loc_id).uri
 
     @classmethod
     def dataset_uri_from_id(cls, loc_id):
         """Generate a URI for RDF triples based on LoC dataset"""
-        if loc_id.startswith('n'):
-            return urljoin(cls.lcnaf_base, loc_id)
-        elif loc_id.startswith('sh'):
-            return urljoin(cls.lcsh_base, loc_id)
-        elif loc_id.startswith('sj'):
-            return urljoin(cls.lcsj_base, loc_id)
-        elif loc_id.startswith('mp'):
-            return urljoin(cls.lcmpt_base, loc_id)
-        elif loc_id.startswith('dg'):
-            return urljoin(cls.lcdgt_base, loc_id)
-        elif loc_id.startswith('tgm'):
-            return urljoin(cls.tgm_base, loc_id)
-        elif loc_id.startswith('afset'):
-            return urljoin(cls.afset_base, loc_id)
-        elif loc_id.startswith('gf'):
-            return urljoin(cls.lcgft_base, loc_id)
-        else:
-            # Throw error if URL malformed
-            raise ValueError("""
-            The ID does not conform to supported ID formats.
-            Please verify the ID is correct.
-            """)
+        return LocIdCodec.parse(loc_id).dataset_uri
 
     @classmethod
     def rwo_uri_from_id(cls, loc_id):
-        """Generate RWO URI for linked data queries"""
-        return urljoin(cls.rwo_base, loc_id)
+        """Generate RWO URI for linked data queries. Returns `None` for
+        identifiers outside the Name Authority, which have no RWO URI"""
+        return LocIdCodec.parse(loc_id).rwo_uri
 
     def suggest(self, query, authority: Literal[None, 'names', 'subjects'] = None):
         """Query LoC's suggest service API using left-anchored search. Returns
@@ -85,6 +84,17 @@ class LocAPI(object):
 
         Querying the older Suggest 1.0 is not implemented.
 
+        :param query: Search query (string)
+        :param authority: LoC authority to search. Supports names or subjects
+        """
+        return self.suggest_result(query, authority).records
+
+    def suggest_result(
+        self, query, authority: Literal[None, 'names', 'subjects'] = None
+    ):
+        """Query LoC's suggest service API using left-anchored search, as
+        :meth:`suggest`, but return the response as :class:`SRUResult`.
+
         :param query: Search query (string)
         :param authority: LoC authority to search. Supports names or subjects
         """
@@ -104,13 +114,11 @@ class LocAPI(object):
         params = {'q': query}
         response = requests.get(query_url, params=params)
         if response.status_code == requests.codes.ok:
-            data = SRUResult(response.json())
-            if data.total_results > 0:
-                return data.records
+            return SRUResult(response.json())
 
         response.raise_for_status()
 
-        return []
+        return SRUResult({})
 
     # not very DRY since this largely repeats logic of suggest method
     # could these two be combined and search param for search type be provided?
@@ -136,23 +144,270 @@ class LocAPI(object):
 
         return []
 
-    def retrieve_label(self, label):
-        """Query LoC's label retrieval API to return a URI from
-        a known label"""
+    def retrieve_label(
+        self, label, authority: Literal[None, 'names', 'subjects'] = None
+    ):
+        """Query LoC's label retrieval API to return an identifier from
+        a known label. Error responses, including 404 for an unknown
+        label, raise :class:`requests.HTTPError`. Returns `None` only for
+        a response that is neither an error nor a redirect to a
+        matching entity.
 
-        # TODO: Allow authorities to be passed in query
-        base_url = 'https://id.loc.gov/authorities/label/'
-        query_url = urljoin(base_url, label)
-        response = requests.get(query_url, allow_redirects=False)
+        :param label: Known label (string)
+        :param authority: LoC authority to search. Supports names or subjects
+        """
+        response = requests.head(
+            self.label_url(label, authority), allow_redirects=False
+        )
         # successful query should return a redirect
-        if response.status_code == 302:
-            uri = response.headers['x-uri']
-            identifier = uri.split('/')[-1]
-            return identifier
+        match = self._label_match(response)
+        if match.loc_id is not None:
+            return match.loc_id
+
+        response.raise_for_status()
+
+        return None
+
+    def retrieve_labels(
+        self,
+        labels,
+        authority: Literal[None, 'names', 'subjects'] = None,
+        max_workers=8,
+    ):
+        """Look up many known labels concurrently with lightweight HEAD
+        requests. Returns a `dict` mapping each label to a
+        :class:`LabelMatch`, in input order.
+
+        Labels LoC reports as not found are remembered in
+        :attr:`label_misses` and are not requested again; any other
+        unsuccessful response or request error is retried on the next
+        call.
+
+        :param labels: Iterable of known labels
+        :param authority: LoC authority to search. Supports names or subjects
+        :param max_workers: Maximum number of concurrent requests (int)
+        """
+        labels = list(dict.fromkeys(labels))
+        results = {}
+        pending = []
+        for label in labels:
+            reason = self.label_misses.get((authority, label))
+            if reason is not None:
+                results[label] = LabelMatch(None, reason)
+            else:
+                pending.append(label)
+
+        # one session per worker thread, to reuse connections
+        local = threading.local()
+        sessions = []
+
+        def head(label):
+            if not hasattr(local, 'session'):
+                local.session = requests.Session()
+                sessions.append(local.session)
+            return local.session.head(
+                self.label_url(label, authority), allow_redirects=False
+            )
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(head, label): label for label in pending}
+                for future in as_completed(futures):
+                    label = futures[future]
+                    try:
+                        response = future.result()
+                    except requests.RequestException as err:
+                        results[label] = LabelMatch(None, f'request failed: {err}')
+                        continue
+                    results[label] = match = self._label_match(response)
+                    # only a 404 is a definite miss; anything else may be
+                    # throttling or a transient error, so try again next time
+                    if response.status_code == requests.codes.not_found:
+                        self.label_misses[(authority, label)] = match.reason
+        finally:
+            for session in sessions:
+                session.close()
+
+        return {label: results[label] for label in labels}
+
+    def _label_match(self, response):
+        if response.status_code in self.redirect_codes and 'x-uri' in response.headers:
+            return LabelMatch(response.headers['x-uri'].split('/')[-1], None)
+        if response.status_code == requests.codes.not_found:
+            return LabelMatch(None, 'not found')
+        return LabelMatch(None, f'unexpected response ({response.status_code})')
+
+
+class LocId(NamedTuple):
+    """Parsed LoC identifier, as returned by :class:`LocIdCodec`"""
+
+    #: Bare LoC identifier, e.g. ``n79043402``
+    loc_id: str
+    #: Dataset the identifier belongs to, e.g. ``names`` or ``subjects``
+    authority: str
+    #: Base URI of the dataset
+    dataset_base: str
+
+    @property
+    def uri(self):
+        """URI in the form used by :meth:`LocAPI.uri_from_id`"""
+        return LocAPI.uri_base + self.loc_id
+
+    @property
+    def dataset_uri(self):
+        """URI in the form used by :meth:`LocAPI.dataset_uri_from_id`"""
+        return self.dataset_base + self.loc_id
+
+    @property
+    def rwo_uri(self):
+        """Real world object URI for name authorities, otherwise `None`"""
+        if self.authority == 'names':
+            return LocAPI.rwo_base + self.loc_id
+
+
+class LabelMatch(NamedTuple):
+    """Result of a known-label lookup, as returned by
+    :meth:`LocAPI.retrieve_labels`"""
+
+    #: LoC identifier, or `None` if there was no match
+    loc_id: str | None
+    #: Reason there was no match, or `None` if there was
+    reason: str | None
 
+
+# up to two lowercase letters, as they may follow an identifier prefix
+_letter_suffixes = [''] + [
+    a + b for a in ascii_lowercase for b in ['', *ascii_lowercase]
+]
+
+
+class LocIdCodec(object):
+    """Table-driven parser for LoC identifiers and URIs. Accepts bare
+    identifiers as well as ``authorities/``, dataset and RWO URIs over
+    http or https, and raises `ValueError` for anything else.
+    """
+
+    #: Identifier prefix -> dataset base URI
+    datasets = {
+        'n': LocAPI.lcnaf_base,
+        'sh': LocAPI.lcsh_base,
+        'sj': LocAPI.lcsj_base,
+        'mp': LocAPI.lcmpt_base,
+        'dg': LocAPI.lcdgt_base,
+        'tgm': LocAPI.tgm_base,
+        'afset': LocAPI.afset_base,
+        'gf': LocAPI.lcgft_base,
+    }
+
+    # URI up to the identifier -> dataset base the identifier must belong
+    # to, or None for any; bare identifiers have an empty head
+    _heads = {
+        base.replace('http:', scheme, 1): base
+        for base in datasets.values()
+        for scheme in ('http:', 'https:')
+    }
+    _heads.update(
+        {
+            '': None,
+            LocAPI.uri_base: None,
+            LocAPI.uri_base.replace('http:', 'https:', 1): None,
+            LocAPI.rwo_base: LocAPI.lcnaf_base,
+            LocAPI.rwo_base.replace('http:', 'https:', 1): LocAPI.lcnaf_base,
+        }
+    )
+    # letters before the numeric part of an identifier -> (authority,
+    # dataset base). A dataset prefix may be followed by up to two more
+    # letters, e.g. the "r" in nr91002273
+    _letters = {
+        p + extra: (base.split('/')[-2], base)
+        for p, base in datasets.items()
+        for extra in _letter_suffixes
+    }
+
+    @classmethod
+    def parse(cls, value):
+        """Parse a LoC identifier or URI. Returns a :class:`LocId`.
+
+        :param value: Bare identifier or id.loc.gov URI (string)
+        """
+        return next(cls.parse_many([value]))
+
+    @classmethod
+    def parse_many(cls, values, strict=True):
+        """Parse an iterable of identifiers or URIs lazily, yielding
+        :class:`LocId` instances in input order.
+
+        :param values: Iterable of identifiers or URIs
+        :param strict: If `True`, raise `ValueError` on malformed input,
+            including values that are not strings; otherwise yield `None`
+            in its place
+        """
+        # tuple.__new__ skips the generated NamedTuple constructor
+        new = tuple.__new__
+        for item in cls._scan(values, strict):
+            yield None if item is None else new(LocId, (item[0], *item[1]))
+
+    @classmethod
+    def normalize_many(
+        cls,
+        values,
+        form: Literal['loc_id', 'uri', 'dataset_uri'] = 'dataset_uri',
+        strict=True,
+    ):
+        """Normalize an iterable of identifiers or URIs lazily, yielding
+        one string per value in the given form. Faster than
+        :meth:`parse_many` for bulk jobs such as deduplication, since no
+        :class:`LocId` is built.
+
+        :param values: Iterable of identifiers or URIs
+        :param form: ``loc_id`` for bare identifiers, ``uri`` for the
+            form used by :meth:`LocAPI.uri_from_id` or ``dataset_uri``
+            for the form used by :meth:`LocAPI.dataset_uri_from_id`
+        :param strict: If `True`, raise `ValueError` on malformed input;
+            otherwise yield `None` in its place
+        """
+        items = cls._scan(values, strict)
+        if form == 'loc_id':
+            for item in items:
+                yield item and item[0]
+        elif form == 'uri':
+            uri_base = LocAPI.uri_base
+            for item in items:
+                yield item and uri_base + item[0]
+        elif form == 'dataset_uri':
+            for item in items:
+                yield item and item[1][1] + item[0]
         else:
-            # TODO: Not covered by test suite. Implement test
-            response.raise_for_status()
+            raise ValueError(f'Unsupported form: {form!r}')
+
+    @classmethod
+    def _scan(cls, values, strict):
+        # yields (loc_id, (authority, dataset base)), or None when not strict
+        # bind lookups locally; this is the hot loop for bulk jobs
+        heads = cls._heads
+        letters = cls._letters
+        missing = object()
+        for value in values:
+            if isinstance(value, str):
+                head, sep, loc_id = value.rpartition('/')
+                required = heads.get(head + sep, missing)
+                # geographic subdivisions carry a suffix, e.g. n78095330-781
+                body, dash, suffix = loc_id.partition('-')
+                stem = body.rstrip('0123456789')
+                parsed = letters.get(stem)
+                if (
+                    parsed is not None
+                    and required is not missing
+                    and len(stem) < len(body)
+                    and (not dash or (suffix.isascii() and suffix.isdigit()))
+                    # the dataset in the URI must agree with the identifier
+                    and (required is None or required == parsed[1])
+                ):
+                    yield loc_id, parsed
+                    continue
+            if strict:
+                raise ValueError(f'Unrecognized LoC identifier or URI: {value!r}')
+            yield None
 
 
 # Question: Does each dataset need its own representation?
@@ -307,12 +562,15 @@ class SubjectEntity(LocEntity):
         components_rdf = rdflib.collection.Collection(self.rdf, c_bnode)
         for c in components_rdf:
             if isinstance(c, rdflib.URIRef):
-                uri = c.split('/')[-1]
-                if uri.startswith('n'):
-                    entity = NameEntity(uri)
+                try:
+                    parsed = LocIdCodec.parse(c)
+                except ValueError:
+                    parsed = None
+                if parsed and parsed.authority == 'names':
+                    entity = NameEntity(parsed.loc_id)
                     components.append(entity)
-                elif uri.startswith('sh'):
-                    entity = SubjectEntity(uri)
+                elif parsed and parsed.authority == 'subjects':
+                    entity = SubjectEntity(parsed.loc_id)
                     components.append(entity)
                 else:
                     # Not covered by test suite
@@ -328,6 +586,334 @@ class SubjectEntity(LocEntity):
             return None
 
 
+class LocCrawler(object):
+    """Breadth-first crawler that builds a local graph of LoC entities
+    by following MADS relationship predicates outward from a set of seed
+    identifiers. Each level of the crawl is fetched concurrently, and the
+    RDF for every entity is merged into a single graph as it arrives.
+
+    ``max_nodes`` limits the number of entities requested by each call
+    to :meth:`crawl`, so calling it again continues with the remaining
+    frontier. Entities reached at ``max_depth`` are kept in
+    :attr:`deferred`, and their neighbors are queued if :meth:`crawl`
+    is called again after raising ``max_depth``. Requests that fail with
+    a server or connection error are kept in :attr:`errors` and retried
+    on the next call. To continue in a new process, pass the previous
+    :attr:`state` to :meth:`from_state` along with the same graph.
+
+    :param seeds: LoC identifiers to start from (iterable of strings)
+    :param predicates: MADS predicates to follow (iterable of
+        :class:`rdflib.URIRef`). Defaults to :attr:`default_predicates`
+    :param max_depth: Maximum number of hops from a seed (int)
+    :param max_nodes: Maximum number of entities to request per call to
+        :meth:`crawl`, or `None` for no limit (int)
+    :param max_workers: Maximum number of concurrent requests (int)
+    :param graph: Graph to merge results into. Pass a graph backed by a
+        persistent store to save results incrementally. Defaults to a new
+        :class:`rdflib.Graph`
+    """
+
+    #: Relationship predicates followed by default: broader, narrower and
+    #: reciprocal authorities (LCSH), plus related authorities and earlier
+    #: and later established forms (LCNAF)
+    default_predicates = (
+        MADS_NS.hasBroaderAuthority,
+        MADS_NS.hasNarrowerAuthority,
+        MADS_NS.hasReciprocalAuthority,
+        MADS_NS.hasRelatedAuthority,
+        MADS_NS.hasEarlierEstablishedForm,
+        MADS_NS.hasLaterEstablishedForm,
+    )
+
+    def __init__(
+        self,
+        seeds,
+        predicates=None,
+        max_depth=1,
+        max_nodes=None,
+        max_workers=8,
+        graph=None,
+    ):
+        self.predicates = tuple(
+            predicates if predicates is not None else self.default_predicates
+        )
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.max_workers = max_workers
+        self.graph = graph if graph is not None else rdflib.Graph()
+        # identifiers fetched successfully
+        self.visited = set()
+        # identifiers that are malformed or were rejected by LoC (4xx)
+        self.failed = set()
+        # identifiers that failed with a retryable error, mapped to their depth
+        self.errors = {}
+        # visited identifiers at the depth limit whose neighbors were not queued
+        self.deferred = {}
+        # identifiers waiting to be fetched, mapped to their depth, in crawl order
+        self.frontier = {}
+        # identifiers already queued, to avoid duplicates in the frontier
+        self._seen = set()
+        for loc_id in seeds:
+            self._enqueue(loc_id, 0)
+
+    @classmethod
+    def from_state(cls, state, **kwargs):
+        """Recreate a crawler from a previous :attr:`state` so an
+        interrupted crawl can continue. Keyword arguments are passed
+        to the constructor."""
+        crawler = cls([], **kwargs)
+        crawler.visited = set(state['visited'])
+        crawler.failed = set(state['failed'])
+        crawler.errors = {loc_id: depth for loc_id, depth in state['errors']}
+        crawler.deferred = {loc_id: depth for loc_id, depth in state['deferred']}
+        crawler._seen = crawler.visited | crawler.failed | set(crawler.errors)
+        for loc_id, depth in state['frontier']:
+            crawler._enqueue(loc_id, depth)
+        return crawler
+
+    @property
+    def state(self):
+        """Crawl progress as a JSON-serializable `dict`, for use
+        with :meth:`from_state`"""
+        return {
+            'visited': sorted(self.visited),
+            'failed': sorted(self.failed),
+            'errors': [[loc_id, depth] for loc_id, depth in self.errors.items()],
+            'deferred': [[loc_id, depth] for loc_id, depth in self.deferred.items()],
+            'frontier': [[loc_id, depth] for loc_id, depth in self.frontier.items()],
+        }
+
+    def _enqueue(self, loc_id, depth):
+        try:
+            loc_id = LocIdCodec.parse(loc_id).loc_id
+        except ValueError:
+            logger.warning(f'Skipping unrecognized LoC identifier: {loc_id}')
+            self.failed.add(loc_id)
+            return
+        if loc_id in self._seen:
+            return
+        self._seen.add(loc_id)
+        self.frontier[loc_id] = depth
+
+    def _fetch(self, loc_id):
+        return LocEntity(loc_id).rdf
+
+    def neighbors(self, loc_id):
+        """Identifiers of LoC entities related to the given identifier
+        through the crawler's predicates, based on data already in
+        :attr:`graph`"""
+        uriref = rdflib.URIRef(LocAPI.dataset_uri_from_id(loc_id))
+        related = []
+        for predicate in self.predicates:
+            for obj in self.graph.objects(uriref, predicate):
+                if not isinstance(obj, rdflib.URIRef):
+                    continue
+                try:
+                    related.append(LocIdCodec.parse(obj).loc_id)
+                except ValueError:
+                    # external authorities, e.g. ULAN, are expected here
+                    logger.debug(f'Not following URI: {obj}')
+        return related
+
+    def _expand(self, loc_id, depth):
+        if depth < self.max_depth:
+            for related_id in self.neighbors(loc_id):
+                self._enqueue(related_id, depth + 1)
+        else:
+            self.deferred[loc_id] = depth
+
+    def crawl(self):
+        """Fetch entities until the frontier is exhausted or ``max_nodes``
+        entities have been requested. Returns :attr:`graph`."""
+        # expand entities deferred by a lower depth limit
+        for loc_id, depth in list(self.deferred.items()):
+            if depth < self.max_depth:
+                del self.deferred[loc_id]
+                self._expand(loc_id, depth)
+        # retry errors from previous calls
+        for loc_id, depth in self.errors.items():
+            self.frontier.setdefault(loc_id, depth)
+        self.errors = {}
+
+        requested = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while self.frontier:
+                batch = list(self.frontier.items())
+                if self.max_nodes is not None:
+                    remaining = self.max_nodes - requested
+                    if remaining <= 0:
+                        break
+                    batch = batch[:remaining]
+                requested += len(batch)
+
+                futures = {
+                    executor.submit(self._fetch, loc_id): (loc_id, depth)
+                    for loc_id, depth in batch
+                }
+                for future in as_completed(futures):
+                    loc_id, depth = futures[future]
+                    try:
+                        rdf = future.result()
+                    except Exception as err:
+                        logger.warning(f'Could not retrieve {loc_id}: {err}')
+                        status = getattr(
+                            getattr(err, 'response', None), 'status_code', None
+                        )
+                        if (
+                            status is not None
+                            and 400 <= status < 500
+                            and status != requests.codes.too_many_requests
+                        ):
+                            self.failed.add(loc_id)
+                        else:
+                            self.errors[loc_id] = depth
+                    else:
+                        # merge in the main thread; rdflib stores are not thread-safe
+                        self.graph += rdf
+                        self.visited.add(loc_id)
+                        self._expand(loc_id, depth)
+                    # only leave the frontier once recorded, so an interrupted
+                    # crawl resumes with any unfinished requests
+                    del self.frontier[loc_id]
+
+        return self.graph
+
+
+# runs of whitespace and punctuation, for SuggestSession.normalize
+_separators = re.compile(r'[\W_]+')
+
+
+class SuggestSession(object):
+    """Typeahead helper around :meth:`LocAPI.suggest` that reduces the
+    number of requests sent while a user types.
+
+    Input passed to :meth:`update` is debounced, and only the response
+    to the most recent query is delivered; responses to superseded
+    queries are discarded. When a query returned fewer results than
+    a full page (see :attr:`SRUResult.complete`), the result set is
+    complete, so longer queries that start with it are answered by
+    filtering those results locally.
+
+    :param authority: LoC authority to search. Supports names or subjects
+    :param api: :class:`LocAPI` instance used for requests
+    :param delay: Seconds to wait for further input before querying (float)
+    """
+
+    def __init__(
+        self,
+        authority: Literal[None, 'names', 'subjects'] = None,
+        api=None,
+        delay=0.25,
+    ):
+        self.authority = authority
+        self.api = api or LocAPI()
+        self.delay = delay
+        # number of suggest requests sent to LoC
+        self.requests_sent = 0
+        # casefolded query -> results, for every query answered so far
+        self._results = {}
+        # casefolded queries whose results are complete
+        self._complete = set()
+        self._lock = threading.Lock()
+        self._timer = None
+        # incremented on each update; older responses are stale
+        self._generation = 0
+
+    @staticmethod
+    def normalize(query):
+        """Normalize a query or label for left-anchored comparison by
+        ignoring case and diacritics, and treating each run of whitespace
+        and punctuation as a single space"""
+        decomposed = unicodedata.normalize('NFKD', query.casefold())
+        stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+        return _separators.sub(' ', stripped).lstrip()
+
+    def _cached(self, query):
+        if query in self._results:
+            return self._results[query]
+        # look for the longest complete result set for a prefix of the query
+        # as sent to LoC; normalized keys alone would let e.g. "new-" answer
+        # "new york", although LoC never matched "new " itself
+        key = self.normalize(query)
+        for end in range(len(query) - 1, 0, -1):
+            prefix = query[:end]
+            if prefix in self._complete:
+                return [
+                    r
+                    for r in self._results[prefix]
+                    if self.normalize(r.suggest_label).startswith(key)
+                    or self.normalize(r.label).startswith(key)
+                ]
+        return None
+
+    def suggest(self, query):
+        """Return suggest results for a query, reusing earlier results
+        where possible. Returns a list of :class:`SRUItem`.
+
+        :param query: Search query (string)
+        """
+        folded = query.casefold()
+        with self._lock:
+            results = self._cached(folded)
+        if results is not None:
+            return results
+
+        result = self.api.suggest_result(query, self.authority)
+        results = result.records
+        with self._lock:
+            self.requests_sent += 1
+            self._results[folded] = results
+            # a query of only whitespace or punctuation says nothing
+            # about longer queries
+            if result.complete and self.normalize(query):
+                self._complete.add(folded)
+        return results
+
+    def update(self, query, callback):
+        """Register new input. After ``delay`` seconds without further
+        input, results are retrieved in the background and passed to
+        ``callback(query, results)``, unless the query has been
+        superseded in the meantime.
+
+        :param query: Current input (string)
+        :param callback: Function called with the query and list of results
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(
+                self.delay, self._run, args=(generation, query, callback)
+            )
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _is_current(self, generation):
+        with self._lock:
+            return generation == self._generation
+
+    def _run(self, generation, query, callback):
+        if not self._is_current(generation):
+            return
+        try:
+            results = self.suggest(query)
+        except requests.RequestException as err:
+            logger.warning(f'Suggest request for {query!r} failed: {err}')
+            return
+        # ignore responses that arrive after newer input
+        if self._is_current(generation):
+            callback(query, results)
+
+    def cancel(self):
+        """Discard any pending or in-flight query"""
+        with self._lock:
+            self._generation += 1
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+
 class SRUResult(object):
     """SRU search result object, for use with :meth:`LocAPI.search`."""
 
@@ -336,6 +922,14 @@ class SRUResult(object):
         # LoC API is buggy and does not have
         # a reliable way to count results
         self.total_results = len(self._results)
+        # number of results LoC returns per page, if included
+        self.page_size = data.get('pagesize')
+
+    @property
+    def complete(self):
+        """`True` if the response is shorter than a full page, so it
+        includes every matching result"""
+        return self.page_size is not None and self.total_results < int(self.page_size)
 
     @cached_property
     def records(self):
@@ -365,3 +959,8 @@ class SRUItem(object):
     def label(self):
         """Authoritative label for this result"""
         return self._data['aLabel']
+
+    @property
+    def suggest_label(self):
+        """Label matched by the suggest service; may be a variant label"""
+        return self._data.get('suggestLabel', self.label)
@@ -1,12 +1,24 @@
 import json
 import os
+import threading
 import pytest
 from unittest.mock import patch, Mock
 
 import requests
 import rdflib
 
-from locpy.api import LocAPI, SRUItem, LocEntity, NameEntity, SubjectEntity, SRUResult
+from locpy.api import (
+    LocAPI,
+    SRUItem,
+    LocEntity,
+    NameEntity,
+    SubjectEntity,
+    SRUResult,
+    LocCrawler,
+    SuggestSession,
+    LocIdCodec,
+    MADS_NS,
+)
 
 
 FIXTURES_PATH = os.path.join(os.path.dirname(__file__), 'fixtures')
@@ -23,6 +35,8 @@ class TestLocAPI(object):
             LocAPI.rwo_uri_from_id('n79043402')
             == 'http://id.loc.gov/rwo/agents/n79043402'
         )
+        # only names have RWO URIs
+        assert LocAPI.rwo_uri_from_id('sh85100849') is None
 
     def test_get_lcnaf_uri(self):
         assert (
@@ -75,6 +89,10 @@ class TestLocAPI(object):
     def test_not_lcsh_err(self):
         with pytest.raises(ValueError):
             LocAPI.dataset_uri_from_id('TR658.3')
+        with pytest.raises(ValueError):
+            LocAPI.uri_from_id('TR658.3')
+        with pytest.raises(ValueError):
+            LocAPI.rwo_uri_from_id('TR658.3')
 
     @patch('locpy.api.requests')
     def test_retrieve_label(self, mockrequests):
@@ -89,9 +107,102 @@ class TestLocAPI(object):
         mock_response = Mock()
         mock_response.status_code = 302
         mock_response.headers = mock_headers
-        mockrequests.get.return_value = mock_response
+        mockrequests.head.return_value = mock_response
 
         assert loc.retrieve_label('Franklin, Benjamin, 1706-1790') == 'n79043402'
+        mockrequests.head.assert_called_with(
+            'https://id.loc.gov/authorities/label/Franklin%2C%20Benjamin%2C%201706-1790',
+            allow_redirects=False,
+        )
+
+        # authority scopes the query
+        loc.retrieve_label('Franklin, Benjamin, 1706-1790', 'names')
+        mockrequests.head.assert_called_with(
+            'https://id.loc.gov/authorities/names/label/Franklin%2C%20Benjamin%2C%201706-1790',
+            allow_redirects=False,
+        )
+
+    @patch('locpy.api.requests.head')
+    def test_retrieve_label_miss(self, mockhead):
+        loc = LocAPI()
+        # a response that is not a redirect does not match
+        mockhead.return_value.status_code = requests.codes.ok
+        mockhead.return_value.headers = {}
+        assert loc.retrieve_label('Not a label') is None
+
+        # errors are raised
+        mockhead.return_value.status_code = requests.codes.not_found
+        mockhead.return_value.raise_for_status.side_effect = requests.HTTPError
+        with pytest.raises(requests.HTTPError):
+            loc.retrieve_label('Not a label')
+
+    @patch('locpy.api.requests.Session')
+    def test_retrieve_labels(self, mocksession):
+        def mock_head(url, **kwargs):
+            response = Mock()
+            response.headers = {}
+            if url.endswith('Franklin%2C%20Benjamin%2C%201706-1790'):
+                response.status_code = 302
+                response.headers['x-uri'] = (
+                    'http://id.loc.gov/authorities/names/n79043402'
+                )
+            elif url.endswith('Busy'):
+                response.status_code = requests.codes.service_unavailable
+            elif url.endswith('Blocked'):
+                response.status_code = requests.codes.forbidden
+            elif url.endswith('No%20redirect'):
+                response.status_code = requests.codes.ok
+            elif url.endswith('Offline'):
+                raise requests.ConnectionError('offline')
+            else:
+                response.status_code = requests.codes.not_found
+            return response
+
+        mocksession.return_value.head.side_effect = mock_head
+        loc = LocAPI()
+        labels = [
+            'Not a label',
+            'Franklin, Benjamin, 1706-1790',
+            'Busy',
+            'Blocked',
+            'No redirect',
+            'Offline',
+            'Not a label',
+        ]
+        results = loc.retrieve_labels(labels, authority='names', max_workers=2)
+        # duplicates are requested once, results are in input order
+        assert list(results) == [
+            'Not a label',
+            'Franklin, Benjamin, 1706-1790',
+            'Busy',
+            'Blocked',
+            'No redirect',
+            'Offline',
+        ]
+        assert mocksession.return_value.head.call_count == 6
+        assert results['Franklin, Benjamin, 1706-1790'].loc_id == 'n79043402'
+        assert results['Not a label'].loc_id is None
+        assert results['Not a label'].reason == 'not found'
+        assert results['Busy'].reason == 'unexpected response (503)'
+        assert results['Blocked'].reason == 'unexpected response (403)'
+        assert results['No redirect'].reason == 'unexpected response (200)'
+        assert results['Offline'].reason.startswith('request failed')
+        mocksession.return_value.head.assert_any_call(
+            'https://id.loc.gov/authorities/names/label/Not%20a%20label',
+            allow_redirects=False,
+        )
+        mocksession.return_value.close.assert_called()
+
+        # only 404s are remembered; everything else is retried
+        assert loc.label_misses == {('names', 'Not a label'): 'not found'}
+        mocksession.return_value.head.reset_mock()
+        retry = ['Busy', 'Blocked', 'No redirect', 'Offline']
+        results = loc.retrieve_labels(['Not a label', *retry], authority='names')
+        assert results['Not a label'].reason == 'not found'
+        requested = [c.args[0] for c in mocksession.return_value.head.call_args_list]
+        assert sorted(requested) == sorted(
+            LocAPI.label_url(label, 'names') for label in retry
+        )
 
     # features to test for search results:
     # constructs URLs correctly for differing authorities
@@ -178,6 +289,109 @@ class TestLocAPI(object):
         assert loc.search('test', 'names') == []
 
 
+class TestLocIdCodec(object):
+    def test_parse_forms(self):
+        forms = [
+            'n79043402',
+            'http://id.loc.gov/authorities/n79043402',
+            'http://id.loc.gov/authorities/names/n79043402',
+            'https://id.loc.gov/authorities/names/n79043402',
+            'http://id.loc.gov/rwo/agents/n79043402',
+        ]
+        for form in forms:
+            parsed = LocIdCodec.parse(form)
+            assert parsed.loc_id == 'n79043402'
+            assert parsed.authority == 'names'
+            assert parsed.uri == 'http://id.loc.gov/authorities/n79043402'
+            assert parsed.dataset_uri == (
+                'http://id.loc.gov/authorities/names/n79043402'
+            )
+            assert parsed.rwo_uri == 'http://id.loc.gov/rwo/agents/n79043402'
+
+    def test_parse_authorities(self):
+        assert LocIdCodec.parse('nr91002273').authority == 'names'
+        assert LocIdCodec.parse('sh85100849').authority == 'subjects'
+        assert LocIdCodec.parse('sj2021051581').authority == 'childrensSubjects'
+        assert LocIdCodec.parse('mp2013015252').authority == 'performanceMediums'
+        assert LocIdCodec.parse('dg2015060711').authority == 'demographicTerms'
+        assert LocIdCodec.parse('tgm000641').authority == 'graphicMaterials'
+        assert LocIdCodec.parse('afset000851').authority == 'ethnographicTerms'
+        assert LocIdCodec.parse('gf2023026091').authority == 'genreForms'
+        # geographic subdivision suffix
+        parsed = LocIdCodec.parse('http://id.loc.gov/rwo/agents/n78095330-781')
+        assert parsed.loc_id == 'n78095330-781'
+        # only names have real world object URIs
+        assert LocIdCodec.parse('sh85100849').rwo_uri is None
+
+    def test_parse_malformed(self):
+        malformed = [
+            'TR658.3',
+            '',
+            'n',
+            'sh85100849x',
+            'n79043402-',
+            '/n79043402',
+            'http://example.com/authorities/names/n79043402',
+            # dataset does not match identifier
+            'http://id.loc.gov/authorities/subjects/n79043402',
+            'http://id.loc.gov/rwo/agents/sh85100849',
+            # not strings
+            None,
+            float('nan'),
+            79043402,
+        ]
+        for value in malformed:
+            with pytest.raises(ValueError):
+                LocIdCodec.parse(value)
+
+    def test_parse_many(self):
+        values = ['n79043402', 'bogus', 'http://id.loc.gov/authorities/sh85100849']
+        parsed = list(LocIdCodec.parse_many(values, strict=False))
+        assert parsed[0].loc_id == 'n79043402'
+        assert parsed[0] == LocIdCodec.parse('n79043402')
+        assert parsed[1] is None
+        assert parsed[2].dataset_uri == (
+            'http://id.loc.gov/authorities/subjects/sh85100849'
+        )
+        # values that are not strings are malformed
+        parsed = list(
+            LocIdCodec.parse_many(['n79043402', None, float('nan')], strict=False)
+        )
+        assert parsed[1:] == [None, None]
+        with pytest.raises(ValueError):
+            list(LocIdCodec.parse_many(['n79043402', None]))
+        # lazy: valid entries before a malformed one are still yielded
+        results = LocIdCodec.parse_many(values)
+        assert next(results).loc_id == 'n79043402'
+        with pytest.raises(ValueError):
+            next(results)
+
+    def test_normalize_many(self):
+        values = [
+            'https://id.loc.gov/rwo/agents/n79043402',
+            'sh85100849',
+            None,
+        ]
+        assert list(LocIdCodec.normalize_many(values, strict=False)) == [
+            'http://id.loc.gov/authorities/names/n79043402',
+            'http://id.loc.gov/authorities/subjects/sh85100849',
+            None,
+        ]
+        assert list(LocIdCodec.normalize_many(values, 'loc_id', strict=False)) == [
+            'n79043402',
+            'sh85100849',
+            None,
+        ]
+        assert list(LocIdCodec.normalize_many(values[:2], 'uri')) == [
+            'http://id.loc.gov/authorities/n79043402',
+            'http://id.loc.gov/authorities/sh85100849',
+        ]
+        with pytest.raises(ValueError):
+            list(LocIdCodec.normalize_many(values))
+        with pytest.raises(ValueError):
+            list(LocIdCodec.normalize_many(values, 'rwo'))
+
+
 class TestLocEntity(object):
     # test entity from an unimplemented API
     test_id = 'mp2013015202'
@@ -306,12 +520,324 @@ class TestSubjectEntity(object):
             assert ent.components is None
 
 
+class TestLocCrawler(object):
+    # fixtures are served by id; anything else is a 404
+    fixture_ids = ('mp2013015202', 'n79043402', 'sh85062079')
+    # ids that respond with a server error or an unparseable body
+    unavailable_id = 'sh99999999'
+    broken_id = 'sh00000000'
+
+    def mock_get(self, url, **kwargs):
+        response = Mock()
+        loc_id = url.split('/')[-1]
+        if loc_id in self.fixture_ids:
+            rdf_fixture = os.path.join(FIXTURES_PATH, f'{loc_id}.rdf')
+            with open(rdf_fixture, encoding='utf-8') as rdffile:
+                response.text = rdffile.read()
+        elif loc_id == self.broken_id:
+            response.text = '<html>oops'
+        else:
+            response.status_code = 503 if loc_id == self.unavailable_id else 404
+            response.raise_for_status.side_effect = requests.HTTPError(
+                str(response.status_code), response=response
+            )
+        return response
+
+    def requested(self, mockget):
+        return [c.args[0].split('/')[-1] for c in mockget.call_args_list]
+
+    @patch('locpy.api.requests.get')
+    def test_crawl(self, mockget):
+        mockget.side_effect = self.mock_get
+        crawler = LocCrawler(['mp2013015202'], max_depth=1)
+        graph = crawler.crawl()
+        # seed and its broader/narrower terms were requested
+        requested = set(self.requested(mockget))
+        assert requested == {'mp2013015202', 'mp2013015545', 'mp2013015713'}
+        assert crawler.visited == {'mp2013015202'}
+        assert crawler.failed == {'mp2013015545', 'mp2013015713'}
+        assert crawler.frontier == {}
+        assert (
+            rdflib.URIRef(LocAPI.dataset_uri_from_id('mp2013015202')),
+            MADS_NS.hasBroaderAuthority,
+            None,
+        ) in graph
+
+    @patch('locpy.api.requests.get')
+    def test_crawl_depth(self, mockget):
+        mockget.side_effect = self.mock_get
+        crawler = LocCrawler(['mp2013015202'], max_depth=0)
+        crawler.crawl()
+        assert mockget.call_count == 1
+        assert crawler.frontier == {}
+        assert crawler.deferred == {'mp2013015202': 0}
+
+        # raising the depth limit expands deferred entities
+        crawler.max_depth = 1
+        crawler.crawl()
+        assert sorted(self.requested(mockget)[1:]) == ['mp2013015545', 'mp2013015713']
+        assert crawler.deferred == {}
+
+    @patch('locpy.api.requests.get')
+    def test_predicates(self, mockget):
+        mockget.side_effect = self.mock_get
+        crawler = LocCrawler(['n79043402'], predicates=[MADS_NS.hasRelatedAuthority])
+        crawler.crawl()
+        # external authorities (e.g. ULAN) are not followed
+        assert set(self.requested(mockget)) == {
+            'n79043402',
+            'no2013006508',
+            'no2005062071',
+        }
+
+    @patch('locpy.api.requests.get')
+    def test_no_predicates(self, mockget):
+        mockget.side_effect = self.mock_get
+        # an explicit empty list is not replaced by the defaults
+        crawler = LocCrawler(['n79043402'], predicates=[])
+        crawler.crawl()
+        assert self.requested(mockget) == ['n79043402']
+
+    @patch('locpy.api.requests.get')
+    def test_malformed_seed(self, mockget):
+        mockget.side_effect = self.mock_get
+        crawler = LocCrawler(
+            ['TR658.3', 'https://id.loc.gov/authorities/names/n79043402'],
+            max_depth=0,
+        )
+        crawler.crawl()
+        assert self.requested(mockget) == ['n79043402']
+        assert crawler.visited == {'n79043402'}
+        assert crawler.failed == {'TR658.3'}
+
+    @patch('locpy.api.requests.get')
+    def test_errors(self, mockget):
+        mockget.side_effect = self.mock_get
+        crawler = LocCrawler([self.broken_id, self.unavailable_id, 'sh85062079'])
+        crawler.max_depth = 0
+        crawler.crawl()
+        assert crawler.visited == {'sh85062079'}
+        # unparseable bodies and server errors can be retried
+        assert crawler.errors == {self.broken_id: 0, self.unavailable_id: 0}
+        assert crawler.failed == set()
+        assert crawler.frontier == {}
+        assert {loc_id for loc_id, _ in crawler.state['errors']} == {
+            self.broken_id,
+            self.unavailable_id,
+        }
+
+        # errors are retried on the next call, including after from_state
+        mockget.reset_mock()
+        resumed = LocCrawler.from_state(crawler.state, max_depth=0)
+        resumed.crawl()
+        assert sorted(self.requested(mockget)) == sorted(
+            [self.broken_id, self.unavailable_id]
+        )
+
+    @patch('locpy.api.requests.get')
+    def test_resume(self, mockget):
+        mockget.side_effect = self.mock_get
+        crawler = LocCrawler(['mp2013015202', 'n79043402'], max_nodes=1)
+        crawler.crawl()
+        assert crawler.visited == {'mp2013015202'}
+        assert list(crawler.frontier) == ['n79043402', 'mp2013015545', 'mp2013015713']
+
+        # max_nodes applies per call, so calling again continues the crawl
+        crawler.crawl()
+        assert self.requested(mockget) == ['mp2013015202', 'n79043402']
+        # LCNAF reciprocal and related authorities are followed by default
+        related = ['n85072885', 'no2005062071', 'no2013006508']
+        assert list(crawler.frontier)[:2] == ['mp2013015545', 'mp2013015713']
+        assert sorted(list(crawler.frontier)[2:]) == related
+
+        # resume from saved state into the same graph; visited ids are not refetched
+        state = json.loads(json.dumps(crawler.state))
+        mockget.reset_mock()
+        resumed = LocCrawler.from_state(state, graph=crawler.graph, max_nodes=1)
+        resumed.crawl()
+        assert self.requested(mockget) == ['mp2013015545']
+        resumed.max_nodes = None
+        resumed.crawl()
+        assert sorted(self.requested(mockget)) == [
+            'mp2013015545',
+            'mp2013015713',
+            *related,
+        ]
+        assert resumed.visited == {'mp2013015202', 'n79043402'}
+        assert resumed.failed == {'mp2013015545', 'mp2013015713', *related}
+        assert resumed.frontier == {}
+        assert len(resumed.graph) > 0
+
+
+class TestSuggestSession(object):
+    def sru_result(self, count, pagesize=10):
+        sru_fixture = os.path.join(FIXTURES_PATH, 'sru_suggest.json')
+        with open(sru_fixture, encoding='utf-8') as srufile:
+            data = json.load(srufile)
+        data['hits'] = data['hits'][:count]
+        data['pagesize'] = pagesize
+        return SRUResult(data)
+
+    def sru_item(self, label):
+        return SRUItem({'aLabel': label, 'suggestLabel': label, 'token': label})
+
+    def test_normalize(self):
+        assert SuggestSession.normalize('Franklin, Benjamin, 1706-1790') == (
+            'franklin benjamin 1706 1790'
+        )
+        # diacritics are ignored
+        assert SuggestSession.normalize('Dvořák, Antonín') == 'dvorak antonin'
+
+    def test_suggest_reuses_complete_results(self):
+        api = Mock()
+        # fewer results than the page size is a complete result set
+        api.suggest_result.return_value = self.sru_result(3)
+        session = SuggestSession(authority='names', api=api)
+        assert len(session.suggest('Franklin, Benjamin')) == 3
+        api.suggest_result.assert_called_once_with('Franklin, Benjamin', 'names')
+
+        # longer queries are filtered locally
+        results = session.suggest('franklin, Benjamin, 17')
+        assert [r.loc_id for r in results] == ['n79043402']
+        assert session.suggest('Franklin, Benjamin, 19') == []
+        # repeated queries are cached
+        session.suggest('Franklin, Benjamin')
+        assert api.suggest_result.call_count == 1
+        assert session.requests_sent == 1
+
+    def test_suggest_local_matching(self):
+        api = Mock()
+        result = self.sru_result(0)
+        result.records = [
+            self.sru_item('Dvořák, Antonín, 1841-1904'),
+            self.sru_item('Newyorkers'),
+            self.sru_item('New York (N.Y.)'),
+        ]
+        api.suggest_result.return_value = result
+        session = SuggestSession(api=api)
+        session.suggest('dv')
+        # unaccented input matches accented labels, as on LoC
+        assert [r.label for r in session.suggest('dvora')] == [
+            'Dvořák, Antonín, 1841-1904'
+        ]
+        session.suggest('ne')
+        # spaces separate words rather than being ignored
+        assert [r.label for r in session.suggest('new york')] == ['New York (N.Y.)']
+        assert [r.label for r in session.suggest('newy')] == ['Newyorkers']
+        assert api.suggest_result.call_count == 2
+
+    def test_suggest_separator_only_query(self):
+        api = Mock()
+        api.suggest_result.return_value = self.sru_result(0)
+        session = SuggestSession(api=api)
+        assert session.suggest(' ') == []
+        # a complete answer for whitespace or punctuation is not reused
+        session.suggest('Franklin')
+        session.suggest('(')
+        session.suggest('(F')
+        assert api.suggest_result.call_count == 4
+
+    def test_suggest_raw_prefix(self):
+        api = Mock()
+        api.suggest_result.return_value = self.sru_result(0)
+        session = SuggestSession(api=api)
+        session.suggest('New-')
+        # normalizes to the same prefix, but LoC was never sent "new "
+        session.suggest('new york')
+        assert api.suggest_result.call_count == 2
+        session.suggest('New York (')
+        assert api.suggest_result.call_count == 2
+
+    def test_suggest_full_page(self):
+        api = Mock()
+        api.suggest_result.return_value = self.sru_result(10)
+        session = SuggestSession(api=api)
+        session.suggest('Franklin, Benjamin')
+        # a full page may be truncated, so longer queries go to LoC
+        session.suggest('Franklin, Benjamin, 17')
+        assert api.suggest_result.call_count == 2
+
+    def test_suggest_without_page_size(self):
+        api = Mock()
+        api.suggest_result.return_value = SRUResult({'hits': []})
+        session = SuggestSession(api=api)
+        session.suggest('Franklin')
+        # completeness is unknown without a page size in the response
+        session.suggest('Franklin, B')
+        assert api.suggest_result.call_count == 2
+
+    def test_update_debounces(self):
+        api = Mock()
+        api.suggest_result.return_value = self.sru_result(10)
+        session = SuggestSession(api=api, delay=0.05)
+        received = []
+        done = threading.Event()
+
+        def callback(query, results):
+            received.append(query)
+            done.set()
+
+        for query in ['F', 'Fr', 'Fra', 'Fran']:
+            session.update(query, callback)
+        assert done.wait(timeout=5)
+        assert received == ['Fran']
+        api.suggest_result.assert_called_once_with('Fran', None)
+
+    def test_update_ignores_stale_responses(self):
+        release = threading.Event()
+        started = threading.Event()
+        api = Mock()
+
+        def slow_suggest(query, authority):
+            if query == 'Fr':
+                started.set()
+                release.wait(timeout=5)
+            return self.sru_result(10)
+
+        api.suggest_result.side_effect = slow_suggest
+        session = SuggestSession(api=api, delay=0)
+        received = []
+        done = threading.Event()
+
+        def callback(query, results):
+            received.append(query)
+            if query == 'Fran':
+                done.set()
+
+        session.update('Fr', callback)
+        assert started.wait(timeout=5)
+        # newer input arrives while the first request is in flight
+        session.update('Fran', callback)
+        assert done.wait(timeout=5)
+        release.set()
+        # first request finishes, but its response is discarded
+        for thread in threading.enumerate():
+            if isinstance(thread, threading.Timer):
+                thread.join(timeout=5)
+        assert received == ['Fran']
+
+    def test_cancel(self):
+        api = Mock()
+        session = SuggestSession(api=api, delay=0.05)
+        callback = Mock()
+        session.update('Franklin', callback)
+        session.cancel()
+        for thread in threading.enumerate():
+            if isinstance(thread, threading.Timer):
+                thread.join(timeout=5)
+        api.suggest_result.assert_not_called()
+        callback.assert_not_called()
+
+
 def test_sru_result():
     sru_fixture = os.path.join(FIXTURES_PATH, 'sru_search.json')
     with open(sru_fixture, encoding='utf-8') as srufile:
         sru_data = json.load(srufile)
     sru_res = SRUResult(sru_data)
     assert sru_res.total_results == 10
+    assert sru_res.page_size == 10
+    # a full page may not include every result
+    assert not sru_res.complete
     assert isinstance(sru_res.records, list)
     assert isinstance(sru_res.records[0], SRUItem)
     assert len(sru_res.records) == 10
@@ -325,3 +851,4 @@ def test_sru_item():
     assert sru_item.uri == 'http://id.loc.gov/authorities/names/nr91002273'
     assert sru_item.loc_id == 'nr91002273'
     assert sru_item.label == 'Joslin, Benjamin F. (Benjamin Franklin), 1796-1861'
+    assert sru_item.suggest_label == sru_item._data['suggestLabel']